@@ -1,5 +1,54 @@
+import asyncio
+import atexit
+from typing import Optional
+
 from .client import GammaClient, AsyncGammaClient
 from .models import *
 from .exceptions import *
 
-__all__ = ["GammaClient", "AsyncGammaClient"]
+__all__ = ["GammaClient", "AsyncGammaClient", "default_async_client", "run"]
+
+def run(coro):
+    """
+    Run a coroutine like asyncio.run, on uvloop when it is installed.
+
+    uvloop's event loop implementation cuts scheduling overhead for httpx
+    fan-out workloads; without it this is plain asyncio.run.
+    """
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    return asyncio.run(coro)
+
+_default_async_client: Optional[AsyncGammaClient] = None
+
+def default_async_client() -> AsyncGammaClient:
+    """
+    Return a process-wide AsyncGammaClient, creating it on first use.
+
+    Reusing a single client keeps the connection pool warm across short
+    jobs and notebook cells instead of paying a TLS handshake per script.
+    The client is closed automatically at interpreter exit.
+    """
+    global _default_async_client
+    if _default_async_client is None:
+        _default_async_client = AsyncGammaClient()
+        atexit.register(_close_default_async_client)
+    return _default_async_client
+
+def _close_default_async_client() -> None:
+    client = _default_async_client
+    if client is None:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # No loop running at exit: close cleanly on a throwaway loop.
+        try:
+            asyncio.run(client.close())
+        except Exception:
+            pass
+    # With a loop still running we cannot await the close here; the OS
+    # reclaims the sockets when the process ends.
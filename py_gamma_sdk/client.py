@@ -1,24 +1,185 @@
+import asyncio
 import httpx
 import logging
+import re
+import time
+from collections import OrderedDict
+
+try:
+    # Optional: orjson decodes large market/event payloads ~2x faster than
+    # the stdlib json module. Install with: pip install polymarket-gamma-sdk[speedups]
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    import json
+    _json_loads = json.loads
+
+try:
+    # Optional: HTTP/2 multiplexes concurrent requests over a single TLS
+    # connection. Install with: pip install polymarket-gamma-sdk[http2]
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+from functools import lru_cache
 from typing import List, Optional, Any, Dict, Union
-from urllib.parse import urlparse
+from urllib.parse import urlencode
 
-from .constants import BASE_URL, DEFAULT_TIMEOUT
+from pydantic import TypeAdapter
+
+from .constants import (
+    BASE_URL, DEFAULT_TIMEOUT, DEFAULT_CACHE_TTL, NEGATIVE_CACHE_TTL, CACHE_MAX_ENTRIES,
+    MAX_KEEPALIVE_CONNECTIONS, MAX_CONNECTIONS, KEEPALIVE_EXPIRY,
+)
 from .exceptions import GammaError, GammaAPIError, NotFoundError, ValidationError
 from .models import Market, Event, Tag, Team, SportMetadata, Series, Comment, Profile
 
 logger = logging.getLogger(__name__)
 
+# ==========================================
+# Model Validation
+# ==========================================
+
+# TypeAdapters are expensive to build but reusable; caching them lets list
+# endpoints validate whole payloads through pydantic-core's batch path
+# instead of constructing one model at a time.
+
+@lru_cache(maxsize=32)
+def _list_adapter(model) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+@lru_cache(maxsize=32)
+def _item_adapter(model) -> TypeAdapter:
+    return TypeAdapter(model)
+
+# ==========================================
+# Response Caching
+# ==========================================
+
+# Sentinels for the response cache: a lookup miss, an expired entry that can
+# still be revalidated with If-None-Match, and a cached 404 so repeated
+# lookups of a missing resource skip the round-trip entirely.
+_CACHE_MISS = object()
+_CACHE_STALE = object()
+_NOT_FOUND = object()
+
+def _cache_get(cache: OrderedDict, key: str) -> tuple:
+    """Look up ``key`` and return ``(value, etag)``.
+
+    ``value`` is ``_CACHE_MISS`` when absent, ``_CACHE_STALE`` when expired but
+    revalidatable via its ETag, otherwise the cached body.
+    """
+    entry = cache.get(key)
+    if entry is None:
+        return _CACHE_MISS, None
+    expiry, etag, value = entry
+    if time.monotonic() >= expiry:
+        if etag is None or value is _NOT_FOUND:
+            del cache[key]
+            return _CACHE_MISS, None
+        return _CACHE_STALE, etag
+    cache.move_to_end(key)
+    return value, etag
+
+def _cache_put(cache: OrderedDict, key: str, value: Any, ttl: float,
+               etag: Optional[str] = None) -> None:
+    """Store ``value`` under ``key`` for ``ttl`` seconds, evicting oldest entries."""
+    cache[key] = (time.monotonic() + ttl, etag, value)
+    cache.move_to_end(key)
+    while len(cache) > CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+def _response_cache_ttl(response: httpx.Response, default: float) -> float:
+    """Derive a TTL from the response's Cache-Control max-age, if present."""
+    cache_control = response.headers.get("Cache-Control", "")
+    for directive in cache_control.split(","):
+        directive = directive.strip()
+        if directive.startswith("max-age="):
+            try:
+                return float(directive[len("max-age="):])
+            except ValueError:
+                break
+    return default
+
+def _param_str(value: Any) -> str:
+    """Stringify a single param value the way httpx does (bools lowercase)."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    return str(value)
+
+def _param_items(params: Dict[str, Any]) -> tuple:
+    """Normalize params to a hashable, sorted tuple of encoded pairs.
+
+    Mirrors httpx's conversion: bools lowercase, None dropped, and list or
+    tuple values expanded into repeated key=value pairs, so the encoded
+    query matches what httpx would have produced.
+    """
+    items = []
+    for key, value in sorted(params.items()):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            items.extend((key, _param_str(item)) for item in value)
+        else:
+            items.append((key, _param_str(value)))
+    return tuple(items)
+
+@lru_cache(maxsize=256)
+def _qs(items: tuple) -> str:
+    """Memoized query-string encoding for repeated identical filters."""
+    return urlencode(items)
+
+# The only URL shape we accept is https://<host>/(market|event)/<slug>; a
+# precompiled regex is much cheaper than a full urlparse for that check.
+_SLUG_RE = re.compile(r"https?://[^/]+/(market|event)/([^/?#]+)")
+
+def _pool_limits() -> httpx.Limits:
+    """Connection pool sized for fan-out workloads rather than httpx defaults."""
+    return httpx.Limits(
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        max_connections=MAX_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+# ==========================================
+# Endpoint Method Codegen
+# ==========================================
+
+def _compile_getter(name, arg, path, model, kind, doc=None, is_async=False):
+    """Build a specialized single-argument endpoint method at import time.
+
+    The generated bytecode has the endpoint f-string, target model and
+    TypeAdapter baked in, so calls skip the generic **kwargs packing and
+    per-call adapter lookup that a shared implementation would pay.
+    """
+    adapter = _list_adapter(model) if kind == "list" else _item_adapter(model)
+    source = (
+        f"{'async ' if is_async else ''}def {name}(self, {arg}):\n"
+        f"    data = {'await ' if is_async else ''}self._client._request('GET', f{path!r}, model=_model)\n"
+        f"    return _adapter.validate_json(data)\n"
+    )
+    namespace = {"_model": model, "_adapter": adapter}
+    exec(compile(source, f"<generated {name}>", "exec"), namespace)
+    method = namespace[name]
+    method.__doc__ = doc
+    return method
+
+
 # ==========================================
 # Synchronous Client Implementation
 # ==========================================
 
 class BaseSyncSubClient:
+    __slots__ = ("_client",)
+
     def __init__(self, client: 'GammaClient'):
         self._client = client
 
 class SportsClient(BaseSyncSubClient):
     """Client for fetching sports-related metadata and team information."""
+    __slots__ = ()
     
     def list_teams(self, **params) -> List[Team]:
         """
@@ -27,8 +188,8 @@ class SportsClient(BaseSyncSubClient):
         :param params: Optional query parameters (e.g., league, name, limit).
         :return: A list of Team objects.
         """
-        data = self._client._request("GET", "/teams", params=params)
-        return [Team(**item) for item in data]
+        data = self._client._request("GET", "/teams", params=params, model=Team)
+        return _list_adapter(Team).validate_json(data)
 
     def get_metadata(self) -> List[SportMetadata]:
         """
@@ -36,8 +197,8 @@ class SportsClient(BaseSyncSubClient):
         
         :return: A list of SportMetadata objects.
         """
-        data = self._client._request("GET", "/sports")
-        return [SportMetadata(**item) for item in data]
+        data = self._client._request("GET", "/sports", model=SportMetadata)
+        return _list_adapter(SportMetadata).validate_json(data)
 
     def get_market_types(self) -> List[str]:
         """
@@ -50,21 +211,20 @@ class SportsClient(BaseSyncSubClient):
 
 class TagsClient(BaseSyncSubClient):
     """Client for managing and discovering tags."""
+    __slots__ = ()
     
     def list(self, **params) -> List[Tag]:
         """List all available tags."""
-        data = self._client._request("GET", "/tags", params=params)
-        return [Tag(**item) for item in data]
+        data = self._client._request("GET", "/tags", params=params, model=Tag)
+        return _list_adapter(Tag).validate_json(data)
 
-    def get_by_id(self, tag_id: str) -> Tag:
-        """Get a specific tag by its unique ID."""
-        data = self._client._request("GET", f"/tags/{tag_id}")
-        return Tag(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "tag_id", "/tags/{tag_id}", Tag, "item",
+        doc="Get a specific tag by its unique ID.")
 
-    def get_by_slug(self, slug: str) -> Tag:
-        """Get a specific tag by its URL slug."""
-        data = self._client._request("GET", f"/tags/slug/{slug}")
-        return Tag(**data)
+    get_by_slug = _compile_getter(
+        "get_by_slug", "slug", "/tags/slug/{slug}", Tag, "item",
+        doc="Get a specific tag by its URL slug.")
 
     def get_related_by_id(self, tag_id: str) -> List[Dict]:
         return self._client._request("GET", f"/tags-related-tag-id/{tag_id}")
@@ -72,39 +232,36 @@ class TagsClient(BaseSyncSubClient):
     def get_related_by_slug(self, slug: str) -> List[Dict]:
         return self._client._request("GET", f"/tags-related-tag-slug/{slug}")
 
-    def get_tags_related_to_id(self, tag_id: str) -> List[Tag]:
-        data = self._client._request("GET", f"/tags/{tag_id}/related")
-        return [Tag(**item) for item in data]
+    get_tags_related_to_id = _compile_getter(
+        "get_tags_related_to_id", "tag_id", "/tags/{tag_id}/related", Tag, "list")
 
-    def get_tags_related_to_slug(self, slug: str) -> List[Tag]:
-        data = self._client._request("GET", f"/tags/slug/{slug}/related")
-        return [Tag(**item) for item in data]
+    get_tags_related_to_slug = _compile_getter(
+        "get_tags_related_to_slug", "slug", "/tags/slug/{slug}/related", Tag, "list")
 
 class EventsClient(BaseSyncSubClient):
     """Client for discovering events (groups of markets)."""
+    __slots__ = ()
     
     def list(self, **params) -> List[Event]:
         """List events based on provided filters."""
-        data = self._client._request("GET", "/events", params=params)
-        return [Event(**item) for item in data]
+        data = self._client._stream_get("/events", params=params)
+        return _list_adapter(Event).validate_json(data)
 
-    def get_by_id(self, event_id: str) -> Event:
-        """Get a specific event by ID."""
-        data = self._client._request("GET", f"/events/{event_id}")
-        return Event(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "event_id", "/events/{event_id}", Event, "item",
+        doc="Get a specific event by ID.")
 
-    def get_tags(self, event_id: str) -> List[Tag]:
-        """Get tags associated with an event."""
-        data = self._client._request("GET", f"/events/{event_id}/tags")
-        return [Tag(**item) for item in data]
+    get_tags = _compile_getter(
+        "get_tags", "event_id", "/events/{event_id}/tags", Tag, "list",
+        doc="Get tags associated with an event.")
 
-    def get_by_slug(self, slug: str) -> Event:
-        """Get an event by its unique slug."""
-        data = self._client._request("GET", f"/events/slug/{slug}")
-        return Event(**data)
+    get_by_slug = _compile_getter(
+        "get_by_slug", "slug", "/events/slug/{slug}", Event, "item",
+        doc="Get an event by its unique slug.")
 
 class MarketsClient(BaseSyncSubClient):
     """Client for accessing Polymarket market data."""
+    __slots__ = ()
     
     def list(self, **params) -> List[Market]:
         """
@@ -112,52 +269,53 @@ class MarketsClient(BaseSyncSubClient):
         
         :param params: Filters like active, tag_id, slug, limit, offset, etc.
         """
-        data = self._client._request("GET", "/markets", params=params)
-        return [Market(**item) for item in data]
+        data = self._client._stream_get("/markets", params=params)
+        return _list_adapter(Market).validate_json(data)
 
-    def get_by_id(self, market_id: str) -> Market:
-        """Get a specific market by its ID."""
-        data = self._client._request("GET", f"/markets/{market_id}")
-        return Market(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "market_id", "/markets/{market_id}", Market, "item",
+        doc="Get a specific market by its ID.")
 
-    def get_tags(self, market_id: str) -> List[Tag]:
-        """Get tags associated with a specific market."""
-        data = self._client._request("GET", f"/markets/{market_id}/tags")
-        return [Tag(**item) for item in data]
+    get_tags = _compile_getter(
+        "get_tags", "market_id", "/markets/{market_id}/tags", Tag, "list",
+        doc="Get tags associated with a specific market.")
 
     def get_by_slug(self, slug: str) -> Market:
         """Get a market by its unique slug."""
-        data = self._client._request("GET", f"/markets/slug/{slug}")
-        if isinstance(data, list):
-            return Market(**data[0]) if data else None
-        return Market(**data)
+        data = self._client._request("GET", f"/markets/slug/{slug}", model=Market)
+        if data.lstrip()[:1] == b"[":
+            items = _list_adapter(Market).validate_json(data)
+            return items[0] if items else None
+        return _item_adapter(Market).validate_json(data)
 
 class SeriesClient(BaseSyncSubClient):
+    __slots__ = ()
+
     def list(self, **params) -> List[Series]:
-        data = self._client._request("GET", "/series", params=params)
-        return [Series(**item) for item in data]
+        data = self._client._request("GET", "/series", params=params, model=Series)
+        return _list_adapter(Series).validate_json(data)
 
-    def get_by_id(self, series_id: str) -> Series:
-        data = self._client._request("GET", f"/series/{series_id}")
-        return Series(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "series_id", "/series/{series_id}", Series, "item")
 
 class CommentsClient(BaseSyncSubClient):
+    __slots__ = ()
+
     def list(self, **params) -> List[Comment]:
-        data = self._client._request("GET", "/comments", params=params)
-        return [Comment(**item) for item in data]
+        data = self._client._request("GET", "/comments", params=params, model=Comment)
+        return _list_adapter(Comment).validate_json(data)
 
-    def get_by_id(self, comment_id: str) -> Comment:
-        data = self._client._request("GET", f"/comments/{comment_id}")
-        return Comment(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "comment_id", "/comments/{comment_id}", Comment, "item")
 
-    def get_by_user(self, address: str) -> List[Comment]:
-        data = self._client._request("GET", f"/comments/user/{address}")
-        return [Comment(**item) for item in data]
+    get_by_user = _compile_getter(
+        "get_by_user", "address", "/comments/user/{address}", Comment, "list")
 
 class ProfilesClient(BaseSyncSubClient):
-    def get_by_address(self, address: str) -> Profile:
-        data = self._client._request("GET", f"/profiles/{address}")
-        return Profile(**data)
+    __slots__ = ()
+
+    get_by_address = _compile_getter(
+        "get_by_address", "address", "/profiles/{address}", Profile, "item")
 
 class GammaClient:
     """
@@ -175,18 +333,39 @@ class GammaClient:
         with GammaClient() as client:
             ...
     """
-    def __init__(self, base_url: str = BASE_URL, timeout: int = DEFAULT_TIMEOUT):
+    __slots__ = ("base_url", "timeout", "_cache_ttl", "_cache", "_ct_cache", "_http_client",
+                 "sports", "tags", "events", "markets", "series", "comments", "profiles")
+
+    _SUBCLIENTS = {
+        "sports": SportsClient,
+        "tags": TagsClient,
+        "events": EventsClient,
+        "markets": MarketsClient,
+        "series": SeriesClient,
+        "comments": CommentsClient,
+        "profiles": ProfilesClient,
+    }
+
+    def __getattr__(self, name: str):
+        # Sub-clients are constructed lazily on first access and cached in
+        # their slot, so unused ones cost nothing at client creation.
+        subclient_cls = type(self)._SUBCLIENTS.get(name)
+        if subclient_cls is None:
+            raise AttributeError(name)
+        instance = subclient_cls(self)
+        object.__setattr__(self, name, instance)
+        return instance
+
+    def __init__(self, base_url: str = BASE_URL, timeout: int = DEFAULT_TIMEOUT,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self._http_client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
-
-        self.sports = SportsClient(self)
-        self.tags = TagsClient(self)
-        self.events = EventsClient(self)
-        self.markets = MarketsClient(self)
-        self.series = SeriesClient(self)
-        self.comments = CommentsClient(self)
-        self.profiles = ProfilesClient(self)
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict = OrderedDict()
+        self._ct_cache: Dict[str, bool] = {}
+        transport = httpx.HTTPTransport(http2=_HTTP2_AVAILABLE, retries=1, limits=_pool_limits())
+        self._http_client = httpx.Client(base_url=self.base_url, timeout=self.timeout,
+                                         transport=transport)
 
     def close(self):
         """Close the underlying HTTPX client."""
@@ -198,24 +377,106 @@ class GammaClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
 
-    def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+    def _request(self, method: str, endpoint: str, model: Any = None, **kwargs) -> Any:
+        params = kwargs.pop("params", None)
+        if params:
+            # Encode the query once (memoized) and fold it into the endpoint,
+            # which doubles as the cache key with no second hash of the params.
+            endpoint = f"{endpoint}?{_qs(_param_items(params))}"
+        cache_key = None
+        if method == "GET" and self._cache_ttl > 0:
+            cache_key = endpoint
+            cached, etag = _cache_get(self._cache, cache_key)
+            if cached is _NOT_FOUND:
+                raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if cached is _CACHE_STALE:
+                kwargs.setdefault("headers", {})["If-None-Match"] = etag
+            elif cached is not _CACHE_MISS:
+                return cached
         try:
             response = self._http_client.request(method, endpoint, **kwargs)
             if response.status_code == 404:
+                if cache_key is not None:
+                    _cache_put(self._cache, cache_key, _NOT_FOUND, NEGATIVE_CACHE_TTL)
                 raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if response.status_code == 304 and cache_key is not None:
+                entry = self._cache.get(cache_key)
+                if entry is not None:
+                    _, old_etag, value = entry
+                    _cache_put(self._cache, cache_key, value,
+                               _response_cache_ttl(response, self._cache_ttl),
+                               response.headers.get("ETag", old_etag))
+                    return value
             response.raise_for_status()
-            
-            content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
-                return response.json()
+
+            if model is not None:
+                data = response.content
             else:
-                return response.text.strip('"')
+                # The content type of a given route never changes, so the
+                # substring check only runs on its first response. Key on the
+                # path without the query string and cap the size so
+                # slug-bearing routes cannot grow the dict without bound.
+                path = endpoint.partition("?")[0]
+                is_json = self._ct_cache.get(path)
+                if is_json is None:
+                    is_json = "application/json" in response.headers.get("Content-Type", "")
+                    if len(self._ct_cache) < CACHE_MAX_ENTRIES:
+                        self._ct_cache[path] = is_json
+                data = _json_loads(response.content) if is_json else response.text.strip('"')
+            if cache_key is not None:
+                _cache_put(self._cache, cache_key, data,
+                           _response_cache_ttl(response, self._cache_ttl),
+                           response.headers.get("ETag"))
+            return data
+        except httpx.HTTPStatusError as e:
+            raise GammaAPIError(f"API Error: {e}", status_code=e.response.status_code, response_text=e.response.text)
+        except GammaError:
+            raise
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            raise GammaAPIError(f"Transport error: {e}") from e
+
+    def _stream_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """GET ``endpoint`` with a streamed body and return the raw bytes.
+
+        Large list payloads accumulate chunk-by-chunk into one bytearray
+        instead of httpx buffering the whole body and copying it again for
+        ``response.content``, which lowers peak memory on multi-MB responses.
+        Shares the TTL cache with ``_request``.
+        """
+        if params:
+            endpoint = f"{endpoint}?{_qs(_param_items(params))}"
+        cache_key = None
+        if self._cache_ttl > 0:
+            cache_key = endpoint
+            cached, _ = _cache_get(self._cache, cache_key)
+            if cached is _NOT_FOUND:
+                raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if cached is not _CACHE_MISS and cached is not _CACHE_STALE:
+                return cached
+        try:
+            with self._http_client.stream("GET", endpoint) as response:
+                if response.status_code == 404:
+                    if cache_key is not None:
+                        _cache_put(self._cache, cache_key, _NOT_FOUND, NEGATIVE_CACHE_TTL)
+                    raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+                if response.status_code >= 400:
+                    response.read()
+                response.raise_for_status()
+                buffer = bytearray()
+                for chunk in response.iter_bytes():
+                    buffer += chunk
+            data = bytes(buffer)
+            if cache_key is not None:
+                _cache_put(self._cache, cache_key, data,
+                           _response_cache_ttl(response, self._cache_ttl),
+                           response.headers.get("ETag"))
+            return data
         except httpx.HTTPStatusError as e:
             raise GammaAPIError(f"API Error: {e}", status_code=e.response.status_code, response_text=e.response.text)
         except GammaError:
             raise
-        except Exception as e:
-            raise GammaAPIError(f"Unexpected Error: {e}")
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            raise GammaAPIError(f"Transport error: {e}") from e
 
     def get_status(self) -> str:
         return self._request("GET", "/status")
@@ -228,52 +489,50 @@ class GammaClient:
         """
         Resolve a Polymarket URL to a Market or Event object.
         """
-        slug = self._extract_slug_from_url(url)
-        if not slug:
+        match = _SLUG_RE.match(url)
+        if not match:
             raise ValidationError(f"Invalid Polymarket URL: {url}")
-
-        # Try market first
-        try:
-            return self.markets.get_by_slug(slug)
-        except Exception:
-            pass
-
-        # Try event next
-        try:
-            return self.events.get_by_slug(slug)
-        except Exception:
-            pass
-
+        kind, slug = match.group(1), match.group(2)
+
+        # The path segment already names the likely kind, so try that lookup
+        # first and only fall back on a 404 (negatively cached, so a repeat
+        # resolve of an unknown slug is a dict lookup). Transport and server
+        # errors propagate instead of being swallowed.
+        lookups = [self.markets.get_by_slug, self.events.get_by_slug]
+        if kind == "event":
+            lookups.reverse()
+        for lookup in lookups:
+            try:
+                return lookup(slug)
+            except NotFoundError:
+                continue
         return None
 
     def _extract_slug_from_url(self, url: str) -> Optional[str]:
-        try:
-            parsed = urlparse(url)
-            path_parts = parsed.path.strip("/").split("/")
-            if len(path_parts) >= 2 and path_parts[0] in ["market", "event"]:
-                return path_parts[-1]
-            return None
-        except Exception:
-            return None
+        match = _SLUG_RE.match(url)
+        return match.group(2) if match else None
 
 # ==========================================
 # Asynchronous Client Implementation
 # ==========================================
 
 class BaseAsyncSubClient:
+    __slots__ = ("_client",)
+
     def __init__(self, client: 'AsyncGammaClient'):
         self._client = client
 
 class AsyncSportsClient(BaseAsyncSubClient):
     """Client for fetching sports-related metadata and team information."""
+    __slots__ = ()
     
     async def list_teams(self, **params) -> List[Team]:
-        data = await self._client._request("GET", "/teams", params=params)
-        return [Team(**item) for item in data]
+        data = await self._client._request("GET", "/teams", params=params, model=Team)
+        return _list_adapter(Team).validate_json(data)
 
     async def get_metadata(self) -> List[SportMetadata]:
-        data = await self._client._request("GET", "/sports")
-        return [SportMetadata(**item) for item in data]
+        data = await self._client._request("GET", "/sports", model=SportMetadata)
+        return _list_adapter(SportMetadata).validate_json(data)
 
     async def get_market_types(self) -> List[str]:
         data = await self._client._request("GET", "/sports/market-types")
@@ -281,18 +540,17 @@ class AsyncSportsClient(BaseAsyncSubClient):
 
 class AsyncTagsClient(BaseAsyncSubClient):
     """Client for managing and discovering tags."""
+    __slots__ = ()
     
     async def list(self, **params) -> List[Tag]:
-        data = await self._client._request("GET", "/tags", params=params)
-        return [Tag(**item) for item in data]
+        data = await self._client._request("GET", "/tags", params=params, model=Tag)
+        return _list_adapter(Tag).validate_json(data)
 
-    async def get_by_id(self, tag_id: str) -> Tag:
-        data = await self._client._request("GET", f"/tags/{tag_id}")
-        return Tag(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "tag_id", "/tags/{tag_id}", Tag, "item", is_async=True)
 
-    async def get_by_slug(self, slug: str) -> Tag:
-        data = await self._client._request("GET", f"/tags/slug/{slug}")
-        return Tag(**data)
+    get_by_slug = _compile_getter(
+        "get_by_slug", "slug", "/tags/slug/{slug}", Tag, "item", is_async=True)
 
     async def get_related_by_id(self, tag_id: str) -> List[Dict]:
         return await self._client._request("GET", f"/tags-related-tag-id/{tag_id}")
@@ -300,80 +558,140 @@ class AsyncTagsClient(BaseAsyncSubClient):
     async def get_related_by_slug(self, slug: str) -> List[Dict]:
         return await self._client._request("GET", f"/tags-related-tag-slug/{slug}")
 
-    async def get_tags_related_to_id(self, tag_id: str) -> List[Tag]:
-        data = await self._client._request("GET", f"/tags/{tag_id}/related")
-        return [Tag(**item) for item in data]
+    get_tags_related_to_id = _compile_getter(
+        "get_tags_related_to_id", "tag_id", "/tags/{tag_id}/related", Tag, "list",
+        is_async=True)
+
+    get_tags_related_to_slug = _compile_getter(
+        "get_tags_related_to_slug", "slug", "/tags/slug/{slug}/related", Tag, "list",
+        is_async=True)
 
-    async def get_tags_related_to_slug(self, slug: str) -> List[Tag]:
-        data = await self._client._request("GET", f"/tags/slug/{slug}/related")
-        return [Tag(**item) for item in data]
+    async def get_many_by_slug(self, slugs: List[str], *, concurrency: int = 20) -> List[Optional[Tag]]:
+        """
+        Fetch many tags by slug concurrently.
+
+        :param slugs: Slugs to fetch.
+        :param concurrency: Maximum number of in-flight requests.
+        :return: Results in input order, with None for slugs that 404.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(slug: str) -> Optional[Tag]:
+            async with semaphore:
+                try:
+                    return await self.get_by_slug(slug)
+                except NotFoundError:
+                    return None
+
+        return await asyncio.gather(*(fetch(slug) for slug in slugs))
 
 class AsyncEventsClient(BaseAsyncSubClient):
     """Client for discovering events (groups of markets)."""
+    __slots__ = ()
     
     async def list(self, **params) -> List[Event]:
-        data = await self._client._request("GET", "/events", params=params)
-        return [Event(**item) for item in data]
+        data = await self._client._stream_get("/events", params=params)
+        return _list_adapter(Event).validate_json(data)
+
+    get_by_id = _compile_getter(
+        "get_by_id", "event_id", "/events/{event_id}", Event, "item", is_async=True)
 
-    async def get_by_id(self, event_id: str) -> Event:
-        data = await self._client._request("GET", f"/events/{event_id}")
-        return Event(**data)
+    get_tags = _compile_getter(
+        "get_tags", "event_id", "/events/{event_id}/tags", Tag, "list", is_async=True)
 
-    async def get_tags(self, event_id: str) -> List[Tag]:
-        data = await self._client._request("GET", f"/events/{event_id}/tags")
-        return [Tag(**item) for item in data]
+    get_by_slug = _compile_getter(
+        "get_by_slug", "slug", "/events/slug/{slug}", Event, "item", is_async=True)
 
-    async def get_by_slug(self, slug: str) -> Event:
-        data = await self._client._request("GET", f"/events/slug/{slug}")
-        return Event(**data)
+    async def get_many_by_slug(self, slugs: List[str], *, concurrency: int = 20) -> List[Optional[Event]]:
+        """
+        Fetch many events by slug concurrently.
+
+        :param slugs: Slugs to fetch.
+        :param concurrency: Maximum number of in-flight requests.
+        :return: Results in input order, with None for slugs that 404.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(slug: str) -> Optional[Event]:
+            async with semaphore:
+                try:
+                    return await self.get_by_slug(slug)
+                except NotFoundError:
+                    return None
+
+        return await asyncio.gather(*(fetch(slug) for slug in slugs))
 
 class AsyncMarketsClient(BaseAsyncSubClient):
     """Client for accessing Polymarket market data."""
+    __slots__ = ()
     
     async def list(self, **params) -> List[Market]:
-        data = await self._client._request("GET", "/markets", params=params)
-        return [Market(**item) for item in data]
+        data = await self._client._stream_get("/markets", params=params)
+        return _list_adapter(Market).validate_json(data)
 
-    async def get_by_id(self, market_id: str) -> Market:
-        data = await self._client._request("GET", f"/markets/{market_id}")
-        return Market(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "market_id", "/markets/{market_id}", Market, "item", is_async=True)
 
-    async def get_tags(self, market_id: str) -> List[Tag]:
-        data = await self._client._request("GET", f"/markets/{market_id}/tags")
-        return [Tag(**item) for item in data]
+    get_tags = _compile_getter(
+        "get_tags", "market_id", "/markets/{market_id}/tags", Tag, "list", is_async=True)
 
     async def get_by_slug(self, slug: str) -> Market:
-        data = await self._client._request("GET", f"/markets/slug/{slug}")
-        if isinstance(data, list):
-            return Market(**data[0]) if data else None
-        return Market(**data)
+        data = await self._client._request("GET", f"/markets/slug/{slug}", model=Market)
+        if data.lstrip()[:1] == b"[":
+            items = _list_adapter(Market).validate_json(data)
+            return items[0] if items else None
+        return _item_adapter(Market).validate_json(data)
+
+    async def get_many_by_slug(self, slugs: List[str], *, concurrency: int = 20) -> List[Optional[Market]]:
+        """
+        Fetch many markets by slug concurrently.
+
+        :param slugs: Slugs to fetch.
+        :param concurrency: Maximum number of in-flight requests.
+        :return: Results in input order, with None for slugs that 404.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(slug: str) -> Optional[Market]:
+            async with semaphore:
+                try:
+                    return await self.get_by_slug(slug)
+                except NotFoundError:
+                    return None
+
+        return await asyncio.gather(*(fetch(slug) for slug in slugs))
 
 class AsyncSeriesClient(BaseAsyncSubClient):
+    __slots__ = ()
+
     async def list(self, **params) -> List[Series]:
-        data = await self._client._request("GET", "/series", params=params)
-        return [Series(**item) for item in data]
+        data = await self._client._request("GET", "/series", params=params, model=Series)
+        return _list_adapter(Series).validate_json(data)
 
-    async def get_by_id(self, series_id: str) -> Series:
-        data = await self._client._request("GET", f"/series/{series_id}")
-        return Series(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "series_id", "/series/{series_id}", Series, "item", is_async=True)
 
 class AsyncCommentsClient(BaseAsyncSubClient):
+    __slots__ = ()
+
     async def list(self, **params) -> List[Comment]:
-        data = await self._client._request("GET", "/comments", params=params)
-        return [Comment(**item) for item in data]
+        data = await self._client._request("GET", "/comments", params=params, model=Comment)
+        return _list_adapter(Comment).validate_json(data)
 
-    async def get_by_id(self, comment_id: str) -> Comment:
-        data = await self._client._request("GET", f"/comments/{comment_id}")
-        return Comment(**data)
+    get_by_id = _compile_getter(
+        "get_by_id", "comment_id", "/comments/{comment_id}", Comment, "item",
+        is_async=True)
 
-    async def get_by_user(self, address: str) -> List[Comment]:
-        data = await self._client._request("GET", f"/comments/user/{address}")
-        return [Comment(**item) for item in data]
+    get_by_user = _compile_getter(
+        "get_by_user", "address", "/comments/user/{address}", Comment, "list",
+        is_async=True)
 
 class AsyncProfilesClient(BaseAsyncSubClient):
-    async def get_by_address(self, address: str) -> Profile:
-        data = await self._client._request("GET", f"/profiles/{address}")
-        return Profile(**data)
+    __slots__ = ()
+
+    get_by_address = _compile_getter(
+        "get_by_address", "address", "/profiles/{address}", Profile, "item",
+        is_async=True)
 
 class AsyncGammaClient:
     """
@@ -384,18 +702,40 @@ class AsyncGammaClient:
             status = await client.get_status()
             markets = await client.markets.list(active=True)
     """
-    def __init__(self, base_url: str = BASE_URL, timeout: int = DEFAULT_TIMEOUT):
+    __slots__ = ("base_url", "timeout", "_cache_ttl", "_cache", "_inflight", "_ct_cache", "_http_client",
+                 "sports", "tags", "events", "markets", "series", "comments", "profiles")
+
+    _SUBCLIENTS = {
+        "sports": AsyncSportsClient,
+        "tags": AsyncTagsClient,
+        "events": AsyncEventsClient,
+        "markets": AsyncMarketsClient,
+        "series": AsyncSeriesClient,
+        "comments": AsyncCommentsClient,
+        "profiles": AsyncProfilesClient,
+    }
+
+    def __getattr__(self, name: str):
+        # Sub-clients are constructed lazily on first access and cached in
+        # their slot, so unused ones cost nothing at client creation.
+        subclient_cls = type(self)._SUBCLIENTS.get(name)
+        if subclient_cls is None:
+            raise AttributeError(name)
+        instance = subclient_cls(self)
+        object.__setattr__(self, name, instance)
+        return instance
+
+    def __init__(self, base_url: str = BASE_URL, timeout: int = DEFAULT_TIMEOUT,
+                 cache_ttl: float = DEFAULT_CACHE_TTL):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self._http_client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout)
-
-        self.sports = AsyncSportsClient(self)
-        self.tags = AsyncTagsClient(self)
-        self.events = AsyncEventsClient(self)
-        self.markets = AsyncMarketsClient(self)
-        self.series = AsyncSeriesClient(self)
-        self.comments = AsyncCommentsClient(self)
-        self.profiles = AsyncProfilesClient(self)
+        self._cache_ttl = cache_ttl
+        self._cache: OrderedDict = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._ct_cache: Dict[str, bool] = {}
+        transport = httpx.AsyncHTTPTransport(http2=_HTTP2_AVAILABLE, retries=1, limits=_pool_limits())
+        self._http_client = httpx.AsyncClient(base_url=self.base_url, timeout=self.timeout,
+                                              transport=transport)
 
     async def close(self):
         """Close the underlying HTTPX client."""
@@ -407,24 +747,128 @@ class AsyncGammaClient:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> Any:
+    async def _request(self, method: str, endpoint: str, model: Any = None, **kwargs) -> Any:
+        params = kwargs.pop("params", None)
+        if params:
+            # Encode the query once (memoized) and fold it into the endpoint,
+            # which doubles as the cache key with no second hash of the params.
+            endpoint = f"{endpoint}?{_qs(_param_items(params))}"
+        cache_key = None
+        if method == "GET" and self._cache_ttl > 0:
+            cache_key = endpoint
+            cached, etag = _cache_get(self._cache, cache_key)
+            if cached is _NOT_FOUND:
+                raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if cached is _CACHE_STALE:
+                kwargs.setdefault("headers", {})["If-None-Match"] = etag
+            elif cached is not _CACHE_MISS:
+                return cached
+            # Single-flight: concurrent duplicate GETs collapse into one
+            # round-trip; late arrivals await the first caller's future.
+            inflight = self._inflight.get(cache_key)
+            if inflight is not None:
+                return await inflight
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            try:
+                data = await self._send(method, endpoint, model, cache_key, kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+                future.exception()  # mark retrieved in case nobody else awaits it
+                raise
+            else:
+                future.set_result(data)
+                return data
+            finally:
+                del self._inflight[cache_key]
+        return await self._send(method, endpoint, model, cache_key, kwargs)
+
+    async def _send(self, method: str, endpoint: str, model: Any,
+                    cache_key: Optional[str], kwargs: Dict[str, Any]) -> Any:
         try:
             response = await self._http_client.request(method, endpoint, **kwargs)
             if response.status_code == 404:
+                if cache_key is not None:
+                    _cache_put(self._cache, cache_key, _NOT_FOUND, NEGATIVE_CACHE_TTL)
                 raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if response.status_code == 304 and cache_key is not None:
+                entry = self._cache.get(cache_key)
+                if entry is not None:
+                    _, old_etag, value = entry
+                    _cache_put(self._cache, cache_key, value,
+                               _response_cache_ttl(response, self._cache_ttl),
+                               response.headers.get("ETag", old_etag))
+                    return value
             response.raise_for_status()
-            
-            content_type = response.headers.get("Content-Type", "")
-            if "application/json" in content_type:
-                return response.json()
+
+            if model is not None:
+                data = response.content
             else:
-                return response.text.strip('"')
+                # The content type of a given route never changes, so the
+                # substring check only runs on its first response. Key on the
+                # path without the query string and cap the size so
+                # slug-bearing routes cannot grow the dict without bound.
+                path = endpoint.partition("?")[0]
+                is_json = self._ct_cache.get(path)
+                if is_json is None:
+                    is_json = "application/json" in response.headers.get("Content-Type", "")
+                    if len(self._ct_cache) < CACHE_MAX_ENTRIES:
+                        self._ct_cache[path] = is_json
+                data = _json_loads(response.content) if is_json else response.text.strip('"')
+            if cache_key is not None:
+                _cache_put(self._cache, cache_key, data,
+                           _response_cache_ttl(response, self._cache_ttl),
+                           response.headers.get("ETag"))
+            return data
+        except httpx.HTTPStatusError as e:
+            raise GammaAPIError(f"API Error: {e}", status_code=e.response.status_code, response_text=e.response.text)
+        except GammaError:
+            raise
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            raise GammaAPIError(f"Transport error: {e}") from e
+
+    async def _stream_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+        """GET ``endpoint`` with a streamed body and return the raw bytes.
+
+        Large list payloads accumulate chunk-by-chunk into one bytearray
+        instead of httpx buffering the whole body and copying it again for
+        ``response.content``, which lowers peak memory on multi-MB responses.
+        Shares the TTL cache with ``_request``.
+        """
+        if params:
+            endpoint = f"{endpoint}?{_qs(_param_items(params))}"
+        cache_key = None
+        if self._cache_ttl > 0:
+            cache_key = endpoint
+            cached, _ = _cache_get(self._cache, cache_key)
+            if cached is _NOT_FOUND:
+                raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+            if cached is not _CACHE_MISS and cached is not _CACHE_STALE:
+                return cached
+        try:
+            async with self._http_client.stream("GET", endpoint) as response:
+                if response.status_code == 404:
+                    if cache_key is not None:
+                        _cache_put(self._cache, cache_key, _NOT_FOUND, NEGATIVE_CACHE_TTL)
+                    raise NotFoundError(f"Resource not found: {endpoint}", status_code=404)
+                if response.status_code >= 400:
+                    await response.aread()
+                response.raise_for_status()
+                buffer = bytearray()
+                async for chunk in response.aiter_bytes():
+                    buffer += chunk
+            data = bytes(buffer)
+            if cache_key is not None:
+                _cache_put(self._cache, cache_key, data,
+                           _response_cache_ttl(response, self._cache_ttl),
+                           response.headers.get("ETag"))
+            return data
         except httpx.HTTPStatusError as e:
             raise GammaAPIError(f"API Error: {e}", status_code=e.response.status_code, response_text=e.response.text)
         except GammaError:
             raise
-        except Exception as e:
-            raise GammaAPIError(f"Unexpected Error: {e}")
+        except (httpx.TransportError, httpx.TimeoutException) as e:
+            raise GammaAPIError(f"Transport error: {e}") from e
 
     async def get_status(self) -> str:
         return await self._request("GET", "/status")
@@ -441,26 +885,19 @@ class AsyncGammaClient:
         if not slug:
             raise ValidationError(f"Invalid Polymarket URL: {url}")
 
-        # Try market first
-        try:
-            return await self.markets.get_by_slug(slug)
-        except Exception:
-            pass
-
-        # Try event next
-        try:
-            return await self.events.get_by_slug(slug)
-        except Exception:
-            pass
-
+        # Race both lookups instead of trying market then event serially;
+        # whichever resolves wins and failures are swallowed per branch.
+        market, event = await asyncio.gather(
+            self.markets.get_by_slug(slug),
+            self.events.get_by_slug(slug),
+            return_exceptions=True,
+        )
+        if isinstance(market, Market):
+            return market
+        if isinstance(event, Event):
+            return event
         return None
 
     def _extract_slug_from_url(self, url: str) -> Optional[str]:
-        try:
-            parsed = urlparse(url)
-            path_parts = parsed.path.strip("/").split("/")
-            if len(path_parts) >= 2 and path_parts[0] in ["market", "event"]:
-                return path_parts[-1]
-            return None
-        except Exception:
-            return None
+        match = _SLUG_RE.match(url)
+        return match.group(2) if match else None
@@ -1,2 +1,8 @@
 BASE_URL = "https://gamma-api.polymarket.com"
 DEFAULT_TIMEOUT = 30
+DEFAULT_CACHE_TTL = 60.0
+NEGATIVE_CACHE_TTL = 5.0
+CACHE_MAX_ENTRIES = 512
+MAX_KEEPALIVE_CONNECTIONS = 50
+MAX_CONNECTIONS = 200
+KEEPALIVE_EXPIRY = 30
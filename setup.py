@@ -8,6 +8,10 @@ setup(
         "httpx>=0.24.0",
         "pydantic>=2.0.0",
     ],
+    extras_require={
+        "speedups": ["orjson>=3.0.0", 'uvloop>=0.17.0; sys_platform != "win32"'],
+        "http2": ["h2>=4.0.0"],
+    },
     author="Mateo Bivol",
     author_email="mateo.bivol@mail.utoronto.ca",
     description="Python SDK for Polymarket's Gamma API (Sync & Async)",
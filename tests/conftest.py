@@ -1,8 +1,8 @@
 import pytest
 import pytest_asyncio
-from py_gamma_sdk import GammaClient
+from py_gamma_sdk import AsyncGammaClient
 
 @pytest_asyncio.fixture
 async def client():
-    async with GammaClient() as client:
+    async with AsyncGammaClient() as client:
         yield client
@@ -25,6 +25,65 @@ async def test_not_found_error(client):
         with pytest.raises(NotFoundError):
             await client.markets.get_by_id("999")
 
+@pytest.mark.asyncio
+async def test_get_cached_response(client):
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/markets/1").mock(
+            return_value=Response(200, json={"id": "1", "question": "Q", "conditionId": "0x1", "slug": "s", "outcomes": [], "clobTokenIds": []}, headers={"Content-Type": "application/json"})
+        )
+        first = await client.markets.get_by_id("1")
+        second = await client.markets.get_by_id("1")
+        assert route.call_count == 1
+        assert first.id == second.id == "1"
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicate_gets_coalesce(client):
+    import asyncio
+    mock_market = {"id": "1", "question": "Q", "conditionId": "0x1", "slug": "s", "outcomes": [], "clobTokenIds": []}
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/markets/1").mock(
+            return_value=Response(200, json=mock_market, headers={"Content-Type": "application/json"})
+        )
+        results = await asyncio.gather(*(client.markets.get_by_id("1") for _ in range(5)))
+        assert route.call_count == 1
+        assert all(m.id == "1" for m in results)
+
+@pytest.mark.asyncio
+async def test_etag_revalidation(client):
+    mock_market = {"id": "1", "question": "Q", "conditionId": "0x1", "slug": "s", "outcomes": [], "clobTokenIds": []}
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/markets/1")
+        route.side_effect = [
+            Response(200, json=mock_market, headers={"Content-Type": "application/json", "ETag": '"abc"', "Cache-Control": "max-age=0"}),
+            Response(304, headers={"ETag": '"abc"'}),
+        ]
+        first = await client.markets.get_by_id("1")
+        second = await client.markets.get_by_id("1")
+        assert route.call_count == 2
+        assert route.calls[1].request.headers["If-None-Match"] == '"abc"'
+        assert second.id == first.id == "1"
+
+@pytest.mark.asyncio
+async def test_cache_control_max_age(client):
+    mock_market = {"id": "1", "question": "Q", "conditionId": "0x1", "slug": "s", "outcomes": [], "clobTokenIds": []}
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/markets/1").mock(
+            return_value=Response(200, json=mock_market, headers={"Content-Type": "application/json", "Cache-Control": "public, max-age=120"})
+        )
+        await client.markets.get_by_id("1")
+        await client.markets.get_by_id("1")
+        assert route.call_count == 1
+
+@pytest.mark.asyncio
+async def test_negative_cache_on_404(client):
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/markets/999").mock(return_value=Response(404))
+        with pytest.raises(NotFoundError):
+            await client.markets.get_by_id("999")
+        with pytest.raises(NotFoundError):
+            await client.markets.get_by_id("999")
+        assert route.call_count == 1
+
 @pytest.mark.asyncio
 async def test_search(client):
     with respx.mock:
@@ -29,3 +29,13 @@ async def test_get_event_tags(client):
         tags = await client.events.get_tags("e1")
         assert len(tags) == 1
         assert tags[0].label == "Politics"
+
+@pytest.mark.asyncio
+async def test_list_events_sequence_params(client):
+    with respx.mock:
+        route = respx.get("https://gamma-api.polymarket.com/events").mock(
+            return_value=Response(200, json=[], headers={"Content-Type": "application/json"})
+        )
+        await client.events.list(tag_id=[1, 2], active=True)
+        url = str(route.calls[0].request.url)
+        assert url.endswith("/events?active=true&tag_id=1&tag_id=2")
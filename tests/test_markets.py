@@ -41,3 +41,24 @@ async def test_list_markets(client):
         markets = await client.markets.list(active=True)
         assert len(markets) == 1
         assert markets[0].slug == "will-it-rain"
+
+@pytest.mark.asyncio
+async def test_get_many_by_slug(client):
+    mock_market = {
+        "id": "123",
+        "question": "Will it rain?",
+        "conditionId": "0xc1",
+        "slug": "will-it-rain",
+        "outcomes": ["Yes", "No"],
+        "clobTokenIds": ["1", "2"]
+    }
+    with respx.mock:
+        respx.get("https://gamma-api.polymarket.com/markets/slug/will-it-rain").mock(
+            return_value=Response(200, json=mock_market, headers={"Content-Type": "application/json"})
+        )
+        respx.get("https://gamma-api.polymarket.com/markets/slug/missing").mock(
+            return_value=Response(404)
+        )
+        markets = await client.markets.get_many_by_slug(["will-it-rain", "missing"])
+        assert markets[0].slug == "will-it-rain"
+        assert markets[1] is None